@@ -2,218 +2,394 @@ import os
 import json
 import datetime as dt
 import sys
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import gspread
+from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 
 
+class ConfigError(Exception):
+    """Raised when required configuration is missing or invalid."""
+
+
+class FetchError(Exception):
+    """Raised when an Anthropic API request fails or returns bad data."""
+
+
+class SheetError(Exception):
+    """Raised when the Google Sheet cannot be opened or used."""
+
+
 # ---------- Config ----------
-DRY_RUN = os.environ.get("DRY_RUN", "").strip().lower() in ("1", "true", "yes")
+# Read an environment variable with surrounding whitespace removed
+def get_env(key: str, default: str = "") -> str:
+    return os.environ.get(key, default).strip()
+
+
+SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+
+# Max rows sent in one Sheets batchUpdate call (keeps requests under the API payload limits)
+SHEETS_CHUNK_ROWS = 5000
 
 # Validate and load environment variables
 def get_required_env(key: str) -> str:
-    value = os.environ.get(key, "").strip()
+    value = get_env(key)
     if not value:
-        print(f"ERROR: Required environment variable '{key}' is missing or empty.")
-        sys.exit(1)
+        raise ConfigError(f"Required environment variable '{key}' is missing or empty.")
     return value
 
-SHEET_ID = get_required_env("GOOGLE_SHEET_ID")
-ADMIN_KEY = get_required_env("ANTHROPIC_ADMIN_KEY")
 
-# Anthropic API configuration
-ANTHROPIC_BASE_URL = os.environ.get("ANTHROPIC_BASE_URL", "https://api.anthropic.com").strip()
-if not ANTHROPIC_BASE_URL.startswith("https://"):
-    print(f"ERROR: ANTHROPIC_BASE_URL must start with 'https://', got: {ANTHROPIC_BASE_URL}")
-    sys.exit(1)
+@dataclass(frozen=True, slots=True)
+class Config:
+    """Validated settings loaded from the environment."""
+    sheet_id: str
+    admin_key: str
+    anthropic_base_url: str
+    usage_endpoint: str
+    cost_endpoint: str
+    anthropic_version: str
+    service_account_json: dict
+    lookback_hours: int
+    dry_run: bool
 
-# Correct Anthropic Admin API endpoints
-USAGE_ENDPOINT = os.environ.get("ANTHROPIC_USAGE_ENDPOINT", "/v1/organizations/usage_report/messages").strip()
-COST_ENDPOINT = os.environ.get("ANTHROPIC_COST_ENDPOINT", "/v1/organizations/cost_report").strip()
-ANTHROPIC_VERSION = os.environ.get("ANTHROPIC_VERSION", "2023-06-01").strip()
 
-# Validate endpoints start with /v1/
-for endpoint_name, endpoint_value in [("USAGE_ENDPOINT", USAGE_ENDPOINT), ("COST_ENDPOINT", COST_ENDPOINT)]:
-    if not endpoint_value.startswith("/v1/"):
-        print(f"ERROR: {endpoint_name} must start with '/v1/', got: {endpoint_value}")
-        sys.exit(1)
+@functools.lru_cache(maxsize=1)
+def _config() -> Config:
+    """Load and validate configuration on first use."""
+    dry_run = get_env("DRY_RUN").lower() in ("1", "true", "yes")
 
-# Load and validate Google service account JSON
-service_account_json_str = get_required_env("GOOGLE_SERVICE_ACCOUNT_JSON")
-try:
-    SERVICE_ACCOUNT_JSON = json.loads(service_account_json_str)
-    if "client_email" not in SERVICE_ACCOUNT_JSON:
-        print("ERROR: GOOGLE_SERVICE_ACCOUNT_JSON missing 'client_email' field.")
-        sys.exit(1)
-    if "private_key" not in SERVICE_ACCOUNT_JSON:
-        print("ERROR: GOOGLE_SERVICE_ACCOUNT_JSON missing 'private_key' field.")
-        sys.exit(1)
-    print(f"Using service account: {SERVICE_ACCOUNT_JSON['client_email']}")
-except json.JSONDecodeError as e:
-    print(f"ERROR: GOOGLE_SERVICE_ACCOUNT_JSON is not valid JSON: {e}")
-    sys.exit(1)
+    sheet_id = get_required_env("GOOGLE_SHEET_ID")
+    admin_key = get_required_env("ANTHROPIC_ADMIN_KEY")
+
+    # Anthropic API configuration
+    anthropic_base_url = get_env("ANTHROPIC_BASE_URL", "https://api.anthropic.com").rstrip("/")
+    if not anthropic_base_url.startswith("https://"):
+        raise ConfigError(f"ANTHROPIC_BASE_URL must start with 'https://', got: {anthropic_base_url}")
+
+    # Correct Anthropic Admin API endpoints
+    usage_endpoint = get_env("ANTHROPIC_USAGE_ENDPOINT", "/v1/organizations/usage_report/messages")
+    cost_endpoint = get_env("ANTHROPIC_COST_ENDPOINT", "/v1/organizations/cost_report")
+    anthropic_version = get_env("ANTHROPIC_VERSION", "2023-06-01")
+
+    # Validate endpoints start with /v1/
+    for endpoint_name, endpoint_value in (("USAGE_ENDPOINT", usage_endpoint), ("COST_ENDPOINT", cost_endpoint)):
+        if not endpoint_value.startswith("/v1/"):
+            raise ConfigError(f"{endpoint_name} must start with '/v1/', got: {endpoint_value}")
+
+    # Allow custom lookback via env var (in hours)
+    lookback_str = get_env("LOOKBACK_HOURS", "24")
+    try:
+        lookback_hours = int(lookback_str)
+    except ValueError as e:
+        raise ConfigError(f"LOOKBACK_HOURS must be an integer, got: {lookback_str}") from e
+
+    # Load and validate Google service account JSON
+    service_account_json_str = get_required_env("GOOGLE_SERVICE_ACCOUNT_JSON")
+    try:
+        service_account_json = json.loads(service_account_json_str)
+        if "client_email" not in service_account_json:
+            raise ConfigError("GOOGLE_SERVICE_ACCOUNT_JSON missing 'client_email' field.")
+        if "private_key" not in service_account_json:
+            raise ConfigError("GOOGLE_SERVICE_ACCOUNT_JSON missing 'private_key' field.")
+        print(f"Using service account: {service_account_json['client_email']}")
+    except json.JSONDecodeError as e:
+        raise ConfigError(f"GOOGLE_SERVICE_ACCOUNT_JSON is not valid JSON: {e}") from e
+
+    return Config(
+        sheet_id=sheet_id,
+        admin_key=admin_key,
+        anthropic_base_url=anthropic_base_url,
+        usage_endpoint=usage_endpoint,
+        cost_endpoint=cost_endpoint,
+        anthropic_version=anthropic_version,
+        service_account_json=service_account_json,
+        lookback_hours=lookback_hours,
+        dry_run=dry_run,
+    )
+
+
+# Shared HTTP session: keeps the TLS connection to the Anthropic API alive
+# across calls and retries transient failures.
+SESSION = requests.Session()
+SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=10,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["GET"],
+            raise_on_status=False,
+        ),
+    ),
+)
 
 
 def iso_now():
-    return dt.datetime.utcnow().replace(microsecond=0).isoformat() + "Z"
+    return dt.datetime.now(dt.UTC).replace(microsecond=0, tzinfo=None).isoformat() + "Z"
 
 
 def fetch_json(path: str, endpoint_name: str = "", params: dict = None):
     """Fetch JSON from Anthropic API with proper error handling."""
-    url = ANTHROPIC_BASE_URL.rstrip("/") + path
-    headers = {
-        "x-api-key": ADMIN_KEY,
-        "anthropic-version": ANTHROPIC_VERSION,
-        "content-type": "application/json",
-    }
+    url = _config().anthropic_base_url + path
 
-    print(f"Fetching {endpoint_name or path}...")
-    print(f"  URL: {url}")
+    # Reports are fetched from worker threads, so emit the whole block in a
+    # single write to keep it from interleaving with other fetches
+    lines = [f"Fetching {endpoint_name or path}...", f"  URL: {url}"]
     if params:
-        print(f"  Params: {params}")
+        lines.append(f"  Params: {params}")
+    print("\n".join(lines) + "\n", end="")
 
     try:
-        resp = requests.get(url, headers=headers, params=params, timeout=30)
+        resp = SESSION.get(url, params=params, timeout=(5, 30))
 
         if resp.status_code != 200:
-            print(f"ERROR: API returned status {resp.status_code}")
-            print(f"Response: {resp.text[:500]}")
-            sys.exit(1)
+            raise FetchError(
+                f"API returned status {resp.status_code}\n"
+                f"Response: {resp.text[:500]}"
+            )
 
-        return resp.json()
+        return orjson.loads(resp.content)
     except requests.exceptions.RequestException as e:
-        print(f"ERROR: Failed to fetch {endpoint_name or path}: {e}")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Failed to parse JSON response: {e}")
-        print(f"Response text: {resp.text[:500]}")
-        sys.exit(1)
+        raise FetchError(f"Failed to fetch {endpoint_name or path}: {e}") from e
+    except orjson.JSONDecodeError as e:
+        raise FetchError(
+            f"Failed to parse JSON response: {e}\n"
+            f"Response text: {resp.text[:500]}"
+        ) from e
+
+
+def fetch_all(path: str, endpoint_name: str = "", params: dict = None):
+    """Yield every page of a paginated Anthropic report.
+
+    The next page is requested in the background while the caller
+    processes the current one.
+    """
+    params = dict(params or {})
+
+    with ThreadPoolExecutor(max_workers=1) as prefetcher:
+        future = prefetcher.submit(fetch_json, path, endpoint_name, params)
+        while future is not None:
+            payload = future.result()
+
+            next_page = payload.get("next_page") if payload.get("has_more") else None
+            future = None
+            if next_page:
+                future = prefetcher.submit(fetch_json, path, endpoint_name, {**params, "page": next_page})
+
+            yield payload
+
+
+def fetch_rows(path: str, endpoint_name: str, params: dict, normalize, ts: str):
+    """Fetch all pages of a report and normalize them into rows."""
+    rows = []
+    for payload in fetch_all(path, endpoint_name, params):
+        rows.extend(normalize(payload, ts))
+    return rows
+
+
+@functools.lru_cache(maxsize=1)
+def _credentials() -> Credentials:
+    """Build service account credentials once, with an access token already fetched."""
+    creds = Credentials.from_service_account_info(_config().service_account_json, scopes=SCOPES)
+    creds.refresh(Request())
+    return creds
 
 
 def open_sheet():
     """Open Google Sheet with validation."""
-    scopes = ["https://www.googleapis.com/auth/spreadsheets"]
+    cfg = _config()
 
     try:
-        creds = Credentials.from_service_account_info(SERVICE_ACCOUNT_JSON, scopes=scopes)
-        gc = gspread.authorize(creds)
-        sh = gc.open_by_key(SHEET_ID)
+        gc = gspread.authorize(_credentials())
+        sh = gc.open_by_key(cfg.sheet_id)
 
         print(f"Opened spreadsheet: {sh.title}")
-
-        # Validate it's actually a Google Sheet
-        try:
-            sh.sheet1  # Try to access default sheet
-        except Exception as e:
-            if "not supported" in str(e).lower():
-                print("ERROR: This document is not a Google Sheet (it may be an XLSX file).")
-                print("Please ensure you're using a Google Sheets spreadsheet.")
-                sys.exit(1)
-            raise
-
         return sh
 
-    except gspread.exceptions.SpreadsheetNotFound:
-        print(f"ERROR: Spreadsheet with ID '{SHEET_ID}' not found.")
-        print(f"Make sure:")
-        print(f"  1. The GOOGLE_SHEET_ID is correct")
-        print(f"  2. The sheet is shared with: {SERVICE_ACCOUNT_JSON['client_email']}")
-        print(f"  3. The service account has 'Editor' permissions")
-        sys.exit(1)
+    except gspread.exceptions.SpreadsheetNotFound as e:
+        raise SheetError(
+            f"Spreadsheet with ID '{cfg.sheet_id}' not found.\n"
+            f"Make sure:\n"
+            f"  1. The GOOGLE_SHEET_ID is correct\n"
+            f"  2. The sheet is shared with: {cfg.service_account_json['client_email']}\n"
+            f"  3. The service account has 'Editor' permissions"
+        ) from e
     except Exception as e:
-        print(f"ERROR: Failed to open Google Sheet: {e}")
-        sys.exit(1)
-
+        # open_by_key already reads the spreadsheet metadata, which the API
+        # rejects for non-Sheets documents, so no separate probe is needed
+        if "not supported" in str(e).lower():
+            raise SheetError(
+                "This document is not a Google Sheet (it may be an XLSX file).\n"
+                "Please ensure you're using a Google Sheets spreadsheet."
+            ) from e
+        raise SheetError(f"Failed to open Google Sheet: {e}") from e
+
+
+def to_cell(value):
+    """Convert a value to Sheets CellData, matching RAW value input."""
+    if value is None or value == "":
+        return {}
+    if isinstance(value, bool):
+        return {"userEnteredValue": {"boolValue": value}}
+    if isinstance(value, (int, float)):
+        return {"userEnteredValue": {"numberValue": value}}
+    return {"userEnteredValue": {"stringValue": str(value)}}
+
+
+def append_cells_request(sheet_id: int, rows):
+    """Build an appendCells request for a spreadsheets.batchUpdate call."""
+    return {
+        "appendCells": {
+            "sheetId": sheet_id,
+            "rows": [{"values": [to_cell(value) for value in row]} for row in rows],
+            "fields": "userEnteredValue",
+        }
+    }
 
-def get_or_create_worksheet(sh, title: str, headers: list):
-    """Get existing worksheet or create it with headers."""
-    try:
-        ws = sh.worksheet(title)
-        print(f"Found existing worksheet: {title}")
-    except gspread.exceptions.WorksheetNotFound:
-        print(f"Creating new worksheet: {title}")
-        ws = sh.add_worksheet(title=title, rows=1000, cols=20)
-        ws.append_row(headers, value_input_option="RAW")
-        print(f"Added headers to {title}: {headers}")
 
-    return ws
+def get_or_create_worksheets(sh, tabs: dict):
+    """Resolve worksheet IDs by title, creating missing tabs with headers.
 
+    Existing tabs are discovered with one metadata request and all missing
+    tabs are added (with their header rows) in one batch update.
+    Returns a {title: sheet_id} mapping.
+    """
+    metadata = sh.fetch_sheet_metadata(params={"fields": "sheets.properties(title,sheetId)"})
+    sheet_ids = {
+        sheet["properties"]["title"]: sheet["properties"]["sheetId"]
+        for sheet in metadata.get("sheets", [])
+    }
 
-def append_rows(ws, rows, sheet_name: str = ""):
-    """Append rows to worksheet, with dry-run support."""
-    if not rows:
-        print(f"No rows to append to {sheet_name or ws.title}")
-        return
+    used_ids = set(sheet_ids.values())
+    next_id = 1
+    create_requests = []
+    created = []
 
-    if DRY_RUN:
-        print(f"\n[DRY RUN] Would append {len(rows)} rows to '{sheet_name or ws.title}':")
-        for i, row in enumerate(rows[:3]):  # Show first 3 rows
-            print(f"  Row {i+1}: {row}")
-        if len(rows) > 3:
-            print(f"  ... and {len(rows) - 3} more rows")
-    else:
-        ws.append_rows(rows, value_input_option="RAW")
-        print(f"Appended {len(rows)} rows to '{sheet_name or ws.title}'")
+    for title, headers in tabs.items():
+        if title in sheet_ids:
+            print(f"Found existing worksheet: {title}")
+            continue
 
+        # Pick the sheet ID ourselves so the header row can go in the same batch
+        while next_id in used_ids:
+            next_id += 1
+        used_ids.add(next_id)
+        sheet_ids[title] = next_id
 
-def normalize_usage(payload: dict):
+        print(f"Creating new worksheet: {title}")
+        create_requests.append({
+            "addSheet": {
+                "properties": {
+                    "sheetId": next_id,
+                    "title": title,
+                    "gridProperties": {"rowCount": 1000, "columnCount": 20},
+                }
+            }
+        })
+        create_requests.append(append_cells_request(next_id, [headers]))
+        created.append((title, headers))
+
+    if create_requests:
+        sh.batch_update({"requests": create_requests})
+        for title, headers in created:
+            print(f"Added headers to {title}: {headers}")
+
+    return sheet_ids
+
+
+def append_rows(sh, sheet_ids: dict, writes, dry_run: bool = False):
+    """Append rows to several worksheets in as few requests as possible, with dry-run support.
+
+    `writes` is a list of (title, rows) pairs. Rows are split into
+    batchUpdate calls of at most SHEETS_CHUNK_ROWS rows each.
+    """
+    batches = [[]]
+    batch_size = 0
+    appended = []
+
+    for title, rows in writes:
+        if not rows:
+            print(f"No rows to append to {title}")
+            continue
+
+        if dry_run:
+            print(f"\n[DRY RUN] Would append {len(rows)} rows to '{title}':")
+            for i, row in enumerate(rows[:3]):  # Show first 3 rows
+                print(f"  Row {i+1}: {row}")
+            if len(rows) > 3:
+                print(f"  ... and {len(rows) - 3} more rows")
+            continue
+
+        for start in range(0, len(rows), SHEETS_CHUNK_ROWS):
+            chunk = rows[start:start + SHEETS_CHUNK_ROWS]
+            if batch_size + len(chunk) > SHEETS_CHUNK_ROWS:
+                batches.append([])
+                batch_size = 0
+            batches[-1].append(append_cells_request(sheet_ids[title], chunk))
+            batch_size += len(chunk)
+        appended.append((title, len(rows)))
+
+    # Chunks are sent in order so rows land in the sheet as they were prepared
+    for batch in batches:
+        if batch:
+            sh.batch_update({"requests": batch})
+
+    for title, count in appended:
+        print(f"Appended {count} rows to '{title}'")
+
+
+def normalize_usage(payload: dict, ts: str):
     """Normalize usage report data into rows."""
-    rows = []
-    ts = iso_now()
-    data_items = payload.get("data", [])
-
-    for data_item in data_items:
-        # Each data item contains results array with actual usage data
-        results = data_item.get("results", [])
-        for item in results:
+    dumps = orjson.dumps
+    # Each data item contains results array with actual usage data
+    return [
+        (
+            ts,
+            item.get("workspace_id") or "",
+            item.get("model") or "",
             # Handle both cached and uncached tokens
-            uncached_input = item.get("uncached_input_tokens", 0)
-            cached_input = item.get("cache_read_input_tokens", 0)
-            total_input_tokens = uncached_input + cached_input
-
-            rows.append([
-                ts,
-                item.get("workspace_id") or "",
-                item.get("model") or "",
-                total_input_tokens,
-                item.get("output_tokens", ""),
-                "",  # cost_usd not in usage report
-                json.dumps(item),
-            ])
-    return rows
+            item.get("uncached_input_tokens", 0) + item.get("cache_read_input_tokens", 0),
+            item.get("output_tokens", ""),
+            "",  # cost_usd not in usage report
+            dumps(item).decode(),
+        )
+        for data_item in payload.get("data", ())
+        for item in data_item.get("results", ())
+    ]
 
 
-def normalize_cost(payload: dict):
+def normalize_cost(payload: dict, ts: str):
     """Normalize cost report data into rows."""
-    rows = []
-    ts = iso_now()
-    data_items = payload.get("data", [])
-
-    for data_item in data_items:
-        # Extract date range from data item
-        period = f"{data_item.get('starting_at', '')} to {data_item.get('ending_at', '')}"
-
-        # Each data item contains results array with actual cost data
-        results = data_item.get("results", [])
-        for item in results:
-            rows.append([
-                ts,
-                item.get("workspace_id") or "",
-                item.get("model") or "",
-                period,  # Use the period from data_item
-                item.get("amount", ""),
-                item.get("description") or item.get("cost_type") or "",
-                json.dumps(item),
-            ])
-    return rows
-
-
-def get_date_range():
-    """Get date range for API queries (last 24 hours by default)."""
-    # Allow custom lookback via env var (in hours)
-    lookback_hours = int(os.environ.get("LOOKBACK_HOURS", "24"))
-
-    ending_at = dt.datetime.utcnow()
+    dumps = orjson.dumps
+    # Each data item carries its date range plus a results array with actual cost data
+    return [
+        (
+            ts,
+            item.get("workspace_id") or "",
+            item.get("model") or "",
+            period,  # Use the period from data_item
+            item.get("amount", ""),
+            item.get("description") or item.get("cost_type") or "",
+            dumps(item).decode(),
+        )
+        for data_item in payload.get("data", ())
+        for period in (f"{data_item.get('starting_at', '')} to {data_item.get('ending_at', '')}",)
+        for item in data_item.get("results", ())
+    ]
+
+
+def get_date_range(lookback_hours: int):
+    """Get date range for API queries covering the last `lookback_hours` hours."""
+    ending_at = dt.datetime.now(dt.UTC)
     starting_at = ending_at - dt.timedelta(hours=lookback_hours)
 
     # Format as ISO 8601 (YYYY-MM-DD)
@@ -223,12 +399,22 @@ def get_date_range():
     }
 
 
-def main():
+def run():
+    cfg = _config()
+    SESSION.headers.update({
+        "x-api-key": cfg.admin_key,
+        "anthropic-version": cfg.anthropic_version,
+        "content-type": "application/json",
+    })
+
+    # Single timestamp shared by every row written in this run
+    ts = iso_now()
+
     print("=" * 60)
     print("Anthropic Usage & Cost Logger")
     print("=" * 60)
 
-    if DRY_RUN:
+    if cfg.dry_run:
         print("\n*** DRY RUN MODE - No data will be written to sheets ***\n")
 
     # Open Google Sheet
@@ -238,35 +424,42 @@ def main():
     usage_headers = ["timestamp", "workspace_id", "model", "input_tokens", "output_tokens", "cost_usd", "raw_json"]
     cost_headers = ["timestamp", "workspace_id", "model", "date", "cost_usd", "usage_type", "raw_json"]
 
-    usage_ws = get_or_create_worksheet(sh, "usage", usage_headers)
-    cost_ws = get_or_create_worksheet(sh, "cost", cost_headers)
+    sheet_ids = get_or_create_worksheets(sh, {"usage": usage_headers, "cost": cost_headers})
 
     # Get date range for API queries
-    date_params = get_date_range()
+    date_params = get_date_range(cfg.lookback_hours)
     print(f"\nFetching data from {date_params['starting_at']} to {date_params['ending_at']}")
 
-    # Fetch data from Anthropic
+    # Fetch and normalize data from Anthropic
     print("\nFetching data from Anthropic API...")
-    usage_payload = fetch_json(USAGE_ENDPOINT, "usage report", params=date_params)
-    cost_payload = fetch_json(COST_ENDPOINT, "cost report", params=date_params)
-
-    # Normalize data
-    print("\nNormalizing data...")
-    usage_rows = normalize_usage(usage_payload)
-    cost_rows = normalize_cost(cost_payload)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        usage_future = executor.submit(
+            fetch_rows, cfg.usage_endpoint, "usage report", date_params, normalize_usage, ts
+        )
+        cost_future = executor.submit(
+            fetch_rows, cfg.cost_endpoint, "cost report", date_params, normalize_cost, ts
+        )
+        usage_rows, cost_rows = usage_future.result(), cost_future.result()
 
     print(f"Prepared {len(usage_rows)} usage rows")
     print(f"Prepared {len(cost_rows)} cost rows")
 
     # Append to sheets
     print("\nWriting to Google Sheets...")
-    append_rows(usage_ws, usage_rows, "usage")
-    append_rows(cost_ws, cost_rows, "cost")
+    append_rows(sh, sheet_ids, [("usage", usage_rows), ("cost", cost_rows)], cfg.dry_run)
 
     print("\n" + "=" * 60)
     print("✓ Sync completed successfully!")
     print("=" * 60)
 
 
+def main():
+    try:
+        run()
+    except (ConfigError, FetchError, SheetError) as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     main()